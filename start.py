@@ -11,18 +11,54 @@ and avoids relying on shell-specific behavior.
 
 from __future__ import annotations
 
-import json
+import functools
 import os
-import platform
-import subprocess
+import signal
 import sys
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
-IS_WINDOWS = platform.system() == "Windows"
+# asyncio, subprocess, json and shutil are imported where they are used so that
+# `--help` and the "setup not detected" exit do not pay for them.
+if TYPE_CHECKING:
+    import subprocess
+
+# Same answer as platform.system() == "Windows" without importing platform
+IS_WINDOWS = os.name == "nt"
 PROGRESS_FILE = ".setup_progress"
+PIDS_FILE = ".suna_pids.json"
+DOCKER_SOCKET = "/var/run/docker.sock"
+DOCKER_PIPE = r"\\.\pipe\docker_engine"
+DOCKER_TCP_PORT = 2375
+
+# Command-line fragments identifying each manually started service
+BACKEND_PATTERN = "python api.py"
+FRONTEND_PATTERN = "next dev"
+WORKER_PATTERN = "dramatiq run_agent_background"
+SERVICE_PATTERNS = (BACKEND_PATTERN, FRONTEND_PATTERN, WORKER_PATTERN)
+
+# Ports probed to decide when a service is ready (see docker-compose.yaml)
+REDIS_PORT = 6379
+BACKEND_PORT = 8000
+FRONTEND_PORT = 3000
+INFRA_READY_TIMEOUT = 30.0
+SERVICE_READY_TIMEOUT = 60.0
+
+# Written inside the venv once its interpreter is known to import the backend runtime packages
+DEPS_STAMP = ".start_py_deps_ok"
+
+# Tries each package on its own so one missing import does not hide the next; prints the missing names
+_DEPS_PROBE = """
+missing = []
+for name in ("fastapi", "dramatiq"):
+    try:
+        __import__(name)
+    except ImportError:
+        missing.append(name)
+print(" ".join(missing))
+"""
 
 
-class Colors:
+class _AnsiColors:
     HEADER = "\033[95m"
     BLUE = "\033[94m"
     CYAN = "\033[96m"
@@ -33,17 +69,45 @@ class Colors:
     BOLD = "\033[1m"
 
 
+class _NullColors:
+    HEADER = ""
+    BLUE = ""
+    CYAN = ""
+    GREEN = ""
+    YELLOW = ""
+    RED = ""
+    ENDC = ""
+    BOLD = ""
+
+
+# Only emit escape codes to a terminal; redirected output (CI, log files) stays plain
+Colors = _AnsiColors if sys.stdout is not None and sys.stdout.isatty() else _NullColors
+
+
 def load_progress() -> Dict:
-    if os.path.exists(PROGRESS_FILE):
-        try:
-            with open(PROGRESS_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            return {"step": 0, "data": {}}
-    return {"step": 0, "data": {}}
+    try:
+        mtime = os.path.getmtime(PROGRESS_FILE)
+    except OSError:
+        return {"step": 0, "data": {}}
+    return _read_progress(mtime)
 
 
-from typing import Optional
+@functools.lru_cache(maxsize=1)
+def _read_progress(mtime: float) -> Dict:
+    # Keyed on mtime so repeated accessors share one read/parse until the file changes.
+    # Callers must treat the returned dict as read-only.
+    try:
+        with open(PROGRESS_FILE, "rb") as f:
+            raw = f.read()
+        try:
+            import orjson
+        except ImportError:
+            import json
+            return json.loads(raw)
+        return orjson.loads(raw)
+    except Exception:
+        return {"step": 0, "data": {}}
+
 
 def get_setup_method() -> Optional[str]:
     p = load_progress()
@@ -55,7 +119,49 @@ def get_supabase_setup_method() -> Optional[str]:
     return p.get("data", {}).get("supabase_setup_method")
 
 
+@functools.lru_cache(maxsize=1)
+def _docker_cli() -> Optional[str]:
+    # Resolved once per process; when the CLI is missing every docker probe can bail out without forking.
+    import shutil
+    return shutil.which("docker")
+
+
+def _docker_endpoint_reachable() -> bool:
+    """Return True if the daemon endpoint from DOCKER_HOST (or the default) accepts a connection."""
+    import socket
+
+    host = os.environ.get("DOCKER_HOST", "")
+    try:
+        if host.startswith("tcp://"):
+            addr, _, port = host[len("tcp://"):].rstrip("/").rpartition(":")
+            with socket.create_connection((addr, int(port)), timeout=0.2):
+                return True
+        if host and not host.startswith("unix://"):
+            return False
+        if IS_WINDOWS:
+            return os.path.exists(DOCKER_PIPE) or _port_open(DOCKER_TCP_PORT)
+        path = host[len("unix://"):] if host else DOCKER_SOCKET
+        # Connecting (not just stat-ing) tells a live daemon apart from a stale socket file
+        with socket.socket(socket.AF_UNIX) as s:
+            s.settimeout(0.2)
+            s.connect(path)
+            return True
+    except (OSError, ValueError):
+        pass
+    return not host and _port_open(DOCKER_TCP_PORT)
+
+
+@functools.lru_cache(maxsize=None)
 def check_docker_available() -> bool:
+    import subprocess
+
+    if _docker_cli() is None:
+        print(f"{Colors.RED}❌ Docker does not appear to be installed (no 'docker' on PATH).{Colors.ENDC}")
+        return False
+    # Talk to the daemon endpoint directly first; `docker info` walks the whole daemon state and can take >1s.
+    if _docker_endpoint_reachable():
+        return True
+    # Endpoints only the CLI knows about (docker contexts, ssh:// hosts) still need the slow probe
     try:
         subprocess.run(["docker", "info"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, shell=IS_WINDOWS)
         return True
@@ -64,7 +170,12 @@ def check_docker_available() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
 def docker_compose_is_up() -> bool:
+    import subprocess
+
+    if _docker_cli() is None:
+        return False
     try:
         res = subprocess.run(["docker", "compose", "ps", "-q"], capture_output=True, text=True, shell=IS_WINDOWS)
         return bool(res.stdout.strip())
@@ -72,7 +183,22 @@ def docker_compose_is_up() -> bool:
         return False
 
 
+def compose_redis_is_up() -> bool:
+    """Whether this project's compose Redis is running (not just anything on 6379)."""
+    import subprocess
+
+    if _docker_cli() is None:
+        return False
+    try:
+        res = subprocess.run(["docker", "compose", "ps", "-q", "redis"], capture_output=True, text=True, shell=IS_WINDOWS)
+        return bool(res.stdout.strip())
+    except Exception:
+        return False
+
+
 def start_docker_services() -> None:
+    import subprocess
+
     if not check_docker_available():
         return
     try:
@@ -84,6 +210,8 @@ def start_docker_services() -> None:
 
 
 def stop_docker_services() -> None:
+    import subprocess
+
     try:
         subprocess.run(["docker", "compose", "down"], check=True, shell=IS_WINDOWS)
         print(f"{Colors.GREEN}✅ Docker Compose services stopped.{Colors.ENDC}")
@@ -91,6 +219,47 @@ def stop_docker_services() -> None:
         print(f"{Colors.RED}Failed to stop Docker Compose services.{Colors.ENDC}")
 
 
+def _scan_procs(patterns: Iterable[str]) -> Dict[str, List[int]]:
+    """Return the PIDs whose command line contains each pattern (like `pgrep -f`).
+
+    Walks /proc once in-process and matches every pattern in a single pass
+    instead of forking one pgrep per service. Systems without procfs (macOS)
+    fall back to parsing a single `ps` listing.
+    """
+    hits: Dict[str, List[int]] = {p: [] for p in patterns}
+    encoded = [(p, p.encode()) for p in hits]
+    me = os.getpid()
+
+    if os.path.isdir("/proc"):
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit() or int(entry) == me:
+                continue
+            try:
+                with open(f"/proc/{entry}/cmdline", "rb") as f:
+                    cmd = f.read().replace(b"\x00", b" ")
+            except OSError:
+                continue
+            for p, raw in encoded:
+                if raw in cmd:
+                    hits[p].append(int(entry))
+        return hits
+
+    import subprocess
+
+    try:
+        out = subprocess.run(["ps", "-Ao", "pid=,command="], capture_output=True, text=True).stdout
+    except OSError:
+        return hits
+    for line in out.splitlines():
+        pid, _, cmd = line.strip().partition(" ")
+        if not pid.isdigit() or int(pid) == me:
+            continue
+        for p in hits:
+            if p in cmd:
+                hits[p].append(int(pid))
+    return hits
+
+
 def print_manual_instructions(supabase_local: bool) -> None:
     step = 1
     if supabase_local:
@@ -99,7 +268,7 @@ def print_manual_instructions(supabase_local: bool) -> None:
         step += 1
 
     print(f"{Colors.BOLD}{step}. Start Infrastructure (in project root):{Colors.ENDC}")
-    print(f"  {Colors.CYAN}docker compose up redis rabbitmq -d{Colors.ENDC}\n")
+    print(f"  {Colors.CYAN}docker compose up redis -d{Colors.ENDC}\n")
     step += 1
 
     print(f"{Colors.BOLD}{step}. Start Frontend (in a new terminal):{Colors.ENDC}")
@@ -118,14 +287,305 @@ def print_manual_instructions(supabase_local: bool) -> None:
         print(f"  {Colors.CYAN}cd backend && npx supabase stop{Colors.ENDC}\n")
 
 
-def start_manual_services(supabase_local: bool) -> None:
+@functools.lru_cache(maxsize=1)
+def _venv_python() -> str:
+    """Absolute path of the interpreter used for the backend and worker.
+
+    Prefers backend/.venv, then the project .venv, then the current interpreter.
+    The path is absolute so it resolves regardless of the child's cwd.
+    """
+    for vp in (os.path.join("backend", ".venv"), ".venv"):
+        p = os.path.join(vp, "Scripts", "python.exe") if IS_WINDOWS else os.path.join(vp, "bin", "python")
+        if os.path.exists(p):
+            return os.path.abspath(p)
+    return sys.executable
+
+
+def _venv_env(python_exec: str) -> Optional[Dict[str, str]]:
+    """Environment equivalent to `source <venv>/bin/activate` for a venv interpreter.
+
+    Lets children run the venv python directly (no shell, no `source`) while
+    still resolving venv console scripts from PATH. Returns None when
+    `python_exec` does not live in a virtualenv, so the parent env is inherited.
+    """
+    bin_dir = os.path.dirname(os.path.abspath(python_exec))
+    venv_dir = os.path.dirname(bin_dir)
+    if not os.path.exists(os.path.join(venv_dir, "pyvenv.cfg")):
+        return None
+    env = dict(os.environ)
+    env["PATH"] = bin_dir + os.pathsep + env.get("PATH", "")
+    env["VIRTUAL_ENV"] = venv_dir
+    env.pop("PYTHONHOME", None)
+    return env
+
+
+def _python_child_env(python_exec: str) -> Dict[str, str]:
+    env = _venv_env(python_exec) or dict(os.environ)
+    # Python block-buffers stdout when it is a file; make log lines show up as soon as they are printed
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+
+def _check_backend_deps(python_exec: str) -> None:
+    """Warn when `python_exec` cannot import FastAPI and Dramatiq.
+
+    The probe costs a cold interpreter start, so one interpreter checks both
+    packages and success is remembered in a stamp file inside the venv. The
+    stamp is keyed on the interpreter path plus the mtimes of pyvenv.cfg and
+    the venv's site-packages directories, so recreating the venv or installing
+    / removing packages (pip, `uv sync`) makes the probe run again.
+    """
+    import glob
+
+    python_exec = os.path.abspath(python_exec)
+    venv_dir = os.path.dirname(os.path.dirname(python_exec))
+    cfg = os.path.join(venv_dir, "pyvenv.cfg")
+    stamp = os.path.join(venv_dir, DEPS_STAMP) if os.path.exists(cfg) else None
+    # Not the interpreter's own mtime: venv pythons are symlinks to a base interpreter
+    # that does not change when packages do.
+    site_dirs = sorted(
+        glob.glob(os.path.join(venv_dir, "lib", "python*", "site-packages"))
+        + glob.glob(os.path.join(venv_dir, "Lib", "site-packages"))
+    )
+    try:
+        key: Optional[str] = "\n".join([python_exec] + [f"{p} {os.path.getmtime(p)}" for p in [cfg] + site_dirs])
+    except OSError:
+        key = None
+
+    if stamp and key:
+        try:
+            with open(stamp, "r") as f:
+                if f.read() == key:
+                    return
+        except OSError:
+            pass
+
+    import subprocess
+
+    try:
+        check = subprocess.run([python_exec, "-c", _DEPS_PROBE], capture_output=True, text=True)
+    except Exception:
+        return
+
+    missing = check.stdout.split() if check.returncode == 0 else None
+    if missing == []:
+        if stamp and key:
+            try:
+                with open(stamp, "w") as f:
+                    f.write(key)
+            except OSError:
+                pass
+        return
+
+    if missing is not None:
+        if "fastapi" in missing:
+            print(f"{Colors.YELLOW}⚠️  The selected Python ({python_exec}) does not seem to have FastAPI installed. The backend may fail to start.{Colors.ENDC}")
+        if "dramatiq" in missing:
+            print(f"{Colors.YELLOW}⚠️  The selected Python ({python_exec}) does not seem to have Dramatiq installed. The worker may fail to start.{Colors.ENDC}")
+    else:
+        # The probe interpreter itself failed, so we cannot tell which package is at fault
+        print(f"{Colors.YELLOW}⚠️  The selected Python ({python_exec}) failed to import FastAPI/Dramatiq. The backend and worker may fail to start.{Colors.ENDC}")
+    print(f"{Colors.CYAN}You can install backend dependencies by running:\n  cd backend && {python_exec} -m pip install -e .\nor re-run the setup wizard and let it install dependencies for you.{Colors.ENDC}")
+
+
+def _port_open(port: int, timeout: float = 0.2) -> bool:
+    """Return True if something accepts TCP connections on 127.0.0.1:port."""
+    import socket
+
+    with socket.socket() as s:
+        s.settimeout(timeout)
+        return s.connect_ex(("127.0.0.1", port)) == 0
+
+
+async def _wait_for_port(port: int, timeout: float, proc: Optional[subprocess.Popen] = None) -> bool:
+    """Poll 127.0.0.1:port every 100 ms until it accepts a connection.
+
+    Returns False on timeout, or as soon as `proc` exits (no point waiting for a
+    service that already crashed).
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if loop.time() >= deadline or (proc is not None and proc.poll() is not None):
+                return False
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+
+async def _start_infra() -> None:
+    import asyncio
+
+    print(f"{Colors.BOLD}1. Starting Infrastructure (Redis)...{Colors.ENDC}")
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "docker", "compose", "up", "redis", "-d",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        returncode = await proc.wait()
+    except OSError:
+        print(f"{Colors.RED}   Failed to run docker compose; is Docker installed?{Colors.ENDC}\n")
+        return
+    if returncode != 0:
+        # Nothing was started, so waiting for the Redis port would only burn the whole timeout
+        print(f"{Colors.RED}   Failed to start Redis via docker compose (exit code {returncode}). See 'docker compose up redis'.{Colors.ENDC}\n")
+        return
+    if await _wait_for_port(REDIS_PORT, INFRA_READY_TIMEOUT):
+        print(f"{Colors.GREEN}   ✓ Infrastructure started{Colors.ENDC}\n")
+    else:
+        print(f"{Colors.YELLOW}⚠️  Redis is not accepting connections on port {REDIS_PORT} yet; continuing anyway.{Colors.ENDC}\n")
+
+
+async def _spawn_backend(backend_log: str, pids: Dict[str, int]) -> None:
+    import subprocess
+
+    print(f"{Colors.BOLD}2. Starting Backend API...{Colors.ENDC}")
+
+    if not os.path.isdir("backend"):
+        print(f"{Colors.RED}Backend directory not found; skipping backend start.{Colors.ENDC}")
+        return
+
+    python_exec = _venv_python()
+
+    # The child keeps its own copy of the log fd, so the parent's handle can be closed right away
+    with open(backend_log, "w") as backend_log_f:
+        proc = subprocess.Popen([python_exec, "api.py"], cwd="backend", env=_python_child_env(python_exec), stdout=backend_log_f, stderr=backend_log_f, start_new_session=True)
+    pids["backend"] = proc.pid
+    print(f"{Colors.GREEN}   ✓ Backend starting with: {python_exec} (logs: {backend_log}){Colors.ENDC}\n")
+
+    if await _wait_for_port(BACKEND_PORT, SERVICE_READY_TIMEOUT, proc):
+        print(f"{Colors.GREEN}   ✓ Backend API listening on port {BACKEND_PORT}{Colors.ENDC}")
+    else:
+        print(f"{Colors.YELLOW}⚠️  Backend API is not listening on port {BACKEND_PORT}; check {backend_log}.{Colors.ENDC}")
+
+
+async def _spawn_frontend(frontend_log: str, pids: Dict[str, int]) -> None:
+    import subprocess
+
+    print(f"{Colors.BOLD}3. Starting Frontend...{Colors.ENDC}")
+    try:
+        with open(frontend_log, "w") as frontend_log_f:
+            proc = subprocess.Popen(["npm", "run", "dev"], cwd="frontend", stdout=frontend_log_f, stderr=frontend_log_f, start_new_session=True)
+    except OSError as e:
+        # Without a shell in between, a missing npm or frontend dir surfaces here instead of in the log
+        print(f"{Colors.RED}Failed to start frontend: {e}{Colors.ENDC}\n")
+        return
+    pids["frontend"] = proc.pid
+    print(f"{Colors.GREEN}   ✓ Frontend starting (logs: {frontend_log}){Colors.ENDC}\n")
+
+    if await _wait_for_port(FRONTEND_PORT, SERVICE_READY_TIMEOUT, proc):
+        print(f"{Colors.GREEN}   ✓ Frontend listening on port {FRONTEND_PORT}{Colors.ENDC}")
+    else:
+        print(f"{Colors.YELLOW}⚠️  Frontend is not listening on port {FRONTEND_PORT}; check {frontend_log}.{Colors.ENDC}")
+
+
+async def _spawn_worker(worker_log: str, pids: Dict[str, int]) -> None:
+    import subprocess
+
+    print(f"{Colors.BOLD}4. Starting Background Worker...{Colors.ENDC}")
+    if not os.path.isdir("backend"):
+        print(f"{Colors.RED}Backend directory not found; skipping worker start.{Colors.ENDC}")
+        return
+
+    python_exec = _venv_python()
+
+    # The worker exposes no port, so there is nothing to wait for once it has been spawned
+    with open(worker_log, "w") as worker_log_f:
+        proc = subprocess.Popen([python_exec, "-m", "dramatiq", "run_agent_background"], cwd="backend", env=_python_child_env(python_exec), stdout=worker_log_f, stderr=worker_log_f, start_new_session=True)
+    pids["worker"] = proc.pid
+    print(f"{Colors.GREEN}   ✓ Background worker starting with: {python_exec} (logs: {worker_log}){Colors.ENDC}\n")
+
+
+async def _start_services(backend_log: str, frontend_log: str, worker_log: str) -> None:
+    import asyncio
+
+    # Backend and worker need Redis, so infra comes first; the rest start concurrently.
+    await _start_infra()
+    # Quick check to warn about missing runtime packages (FastAPI, Dramatiq). The probe
+    # blocks on a cold interpreter, so it runs once here rather than inside the spawners,
+    # where it would stall the event loop and serialize the concurrent launches.
+    if os.path.isdir("backend"):
+        _check_backend_deps(_venv_python())
+    # Spawners record each PID right after Popen, so the sidecar is complete even if
+    # the readiness wait is interrupted (Ctrl-C cancels this task and runs the finally).
+    pids: Dict[str, int] = {}
+    try:
+        await asyncio.gather(
+            _spawn_backend(backend_log, pids),
+            _spawn_frontend(frontend_log, pids),
+            _spawn_worker(worker_log, pids),
+        )
+    finally:
+        _save_pids(pids)
+    print()
+
+
+def _save_pids(pids: Dict[str, int]) -> None:
+    import json
+
+    # Each child leads its own session (start_new_session=True), so its PID is also its process group ID
+    try:
+        with open(PIDS_FILE, "w") as f:
+            json.dump(pids, f)
+    except OSError:
+        pass
+
+
+def _stop_saved_pids() -> bool:
+    """Terminate the process groups recorded by `_save_pids`.
+
+    Returns False when there is no usable sidecar or none of its process groups
+    was still alive (a stale sidecar), so callers can fall back to scanning for
+    the services by command line.
+    """
+    import json
+
+    try:
+        with open(PIDS_FILE, "r") as f:
+            pids = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    signalled = False
+    for pid in pids.values():
+        try:
+            # A group ID that no longer matches means the PID was recycled by an unrelated process
+            if os.getpgid(pid) == pid:
+                os.killpg(pid, signal.SIGTERM)
+                signalled = True
+        except (ProcessLookupError, PermissionError):
+            pass
+    try:
+        os.unlink(PIDS_FILE)
+    except OSError:
+        pass
+    return signalled
+
+
+def start_manual_services(supabase_local: bool, running: Optional[Dict[str, List[int]]] = None) -> None:
     """Start backend, frontend, worker and infra in background (Unix-like systems).
 
     On Windows this function will only print helpful instructions (automation is
-    more reliable on POSIX systems where `pgrep`/`pkill` and process groups are
-    available).
+    more reliable on POSIX systems where process listings, signals and process
+    groups are available).
+
+    `running` is an existing `_scan_procs(SERVICE_PATTERNS)` result; callers that
+    have just scanned can pass it to avoid listing processes a second time.
     """
-    import time
+    import asyncio
+    import shutil
+    import subprocess
     import tempfile
 
     if IS_WINDOWS:
@@ -139,14 +599,9 @@ def start_manual_services(supabase_local: bool) -> None:
     frontend_log = os.path.join(tmp, "suna_frontend.log")
     worker_log = os.path.join(tmp, "suna_worker.log")
 
-    def is_running(pattern: str) -> bool:
-        return subprocess.run(["pgrep", "-f", pattern], capture_output=True).returncode == 0
-
-    backend_running = is_running("python api.py")
-    frontend_running = is_running("next dev")
-    worker_running = is_running("dramatiq run_agent_background")
-
-    if backend_running or frontend_running or worker_running:
+    if running is None:
+        running = _scan_procs(SERVICE_PATTERNS)
+    if any(running.values()):
         print(f"{Colors.YELLOW}⚠️  Some services appear to already be running. Aborting automatic start.{Colors.ENDC}")
         return
 
@@ -191,92 +646,11 @@ def start_manual_services(supabase_local: bool) -> None:
         # Best-effort only; continue starting services even if refresh fails
         pass
 
-    # Start infrastructure (Redis + RabbitMQ)
-    print(f"{Colors.BOLD}1. Starting Infrastructure (Redis, RabbitMQ)...{Colors.ENDC}")
-    subprocess.run(
-        ["docker", "compose", "up", "redis", "rabbitmq", "-d"],
-        shell=IS_WINDOWS,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL
-    )
-    print(f"{Colors.GREEN}   ✓ Infrastructure started{Colors.ENDC}\n")
-    time.sleep(2)
-
-    # Backend
-    print(f"{Colors.BOLD}2. Starting Backend API...{Colors.ENDC}")
-
-    def find_backend_python() -> Optional[str]:
-        # Prefer backend/.venv, then project .venv, then fall back to current interpreter
-        candidates = [os.path.join("backend", ".venv"), ".venv"]
-        for vp in candidates:
-            if os.path.isdir(vp):
-                p = os.path.join(vp, "Scripts", "python.exe") if IS_WINDOWS else os.path.join(vp, "bin", "python")
-                if os.path.exists(p):
-                    return p
-        return None
-
-    if os.path.isdir("backend"):
-        venv_dir = os.path.join("backend", ".venv")
-        venv_python = find_backend_python()
-        python_exec = venv_python or sys.executable
-
-        backend_log_f = open(backend_log, "w")
-
-        # Prefer the virtualenv python executable directly when available to avoid shell activation issues
-        venv_python_exec = os.path.join(venv_dir, "bin", "python") if not IS_WINDOWS else os.path.join(venv_dir, "Scripts", "python.exe")
-        if os.path.isdir(venv_dir) and os.path.exists(venv_python_exec):
-            python_exec = venv_python_exec
-
-        # Quick checks to warn about missing runtime packages (FastAPI)
-        try:
-            fastapi_check = subprocess.run([python_exec, "-c", "import fastapi"], capture_output=True)
-            if fastapi_check.returncode != 0:
-                print(f"{Colors.YELLOW}⚠️  The selected Python ({python_exec}) does not seem to have FastAPI installed. The backend may fail to start.{Colors.ENDC}")
-                print(f"{Colors.CYAN}You can install backend dependencies by running:\n  cd backend && {python_exec} -m pip install -e .\nor re-run the setup wizard and let it install dependencies for you.{Colors.ENDC}")
-        except Exception:
-            pass
-
-        # Ensure absolute path so it resolves regardless of cwd
-        if not os.path.isabs(python_exec):
-            python_exec = os.path.abspath(python_exec)
-        subprocess.Popen([python_exec, "api.py"], cwd="backend", stdout=backend_log_f, stderr=backend_log_f, preexec_fn=(os.setpgrp if not IS_WINDOWS else None))
-        print(f"{Colors.GREEN}   ✓ Backend starting with: {python_exec} (logs: {backend_log}){Colors.ENDC}\n")
-    else:
-        print(f"{Colors.RED}Backend directory not found; skipping backend start.{Colors.ENDC}")
-
-    time.sleep(3)
-
-    # Frontend
-    print(f"{Colors.BOLD}3. Starting Frontend...{Colors.ENDC}")
-    frontend_log_f = open(frontend_log, "w")
-    subprocess.Popen("cd frontend && npm run dev", shell=True, stdout=frontend_log_f, stderr=frontend_log_f, preexec_fn=(os.setpgrp if not IS_WINDOWS else None))
-    print(f"{Colors.GREEN}   ✓ Frontend starting (logs: {frontend_log}){Colors.ENDC}\n")
-
-    time.sleep(2)
-
-    # Worker
-    print(f"{Colors.BOLD}4. Starting Background Worker...{Colors.ENDC}")
-    worker_log_f = open(worker_log, "w")
-    # Prefer explicit virtualenv python if available
-    venv_python_exec = os.path.join("backend", ".venv", "bin", "python")
-    if os.path.isdir(os.path.join("backend", ".venv")) and os.path.exists(venv_python_exec):
-        python_exec = venv_python_exec
-
-    # Quick check for dramatiq
     try:
-        dramatiq_check = subprocess.run([python_exec, "-c", "import dramatiq"], capture_output=True)
-        if dramatiq_check.returncode != 0:
-            print(f"{Colors.YELLOW}⚠️  The selected Python ({python_exec}) does not seem to have Dramatiq installed. The worker may fail to start.{Colors.ENDC}")
-            print(f"{Colors.CYAN}You can install backend dependencies by running:\n  cd backend && {python_exec} -m pip install -e .\nor re-run the setup wizard and let it install dependencies for you.{Colors.ENDC}")
-    except Exception:
-        pass
-
-    # Ensure absolute path so it resolves regardless of cwd
-    if not os.path.isabs(python_exec):
-        python_exec = os.path.abspath(python_exec)
-
-    subprocess.Popen([python_exec, "-m", "dramatiq", "run_agent_background"], cwd="backend", stdout=worker_log_f, stderr=worker_log_f, preexec_fn=(os.setpgrp if not IS_WINDOWS else None))
-    print(f"{Colors.GREEN}   ✓ Background worker starting with: {python_exec} (logs: {worker_log}){Colors.ENDC}\n")
+        asyncio.run(_start_services(backend_log, frontend_log, worker_log))
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}⚠️  Startup interrupted. Services already launched keep running; run './start.py' again to stop them.{Colors.ENDC}")
+        return
 
     if supabase_local:
         print(f"{Colors.BOLD}To stop Local Supabase:{Colors.ENDC}")
@@ -286,22 +660,9 @@ def start_manual_services(supabase_local: bool) -> None:
     print(f"{Colors.CYAN}🌐 Access Suna at: http://localhost:3000{Colors.ENDC}\n")
     print(f"{Colors.YELLOW}💡 Tip:{Colors.ENDC} View logs: tail -f {backend_log} {frontend_log} {worker_log}")
 
-    # Automatically tail the logs in the foreground for convenience on POSIX systems.
-    # This will block until the user quits (Ctrl+C). If `tail` is unavailable, we fall back to showing the tip.
-    try:
-        if not IS_WINDOWS:
-            # Use the system 'tail' command to follow logs
-            subprocess.run(["tail", "-f", backend_log, frontend_log, worker_log])
-    except KeyboardInterrupt:
-        # User interrupted tailing; return to shell
-        print("\nStopped tailing logs.")
-    except FileNotFoundError:
-        # tail not found; already printed the tip above
-        pass
     # Automatically tail logs in the foreground if 'tail' is available. This mirrors the suggested command
     # and gives immediate feedback to the user (press Ctrl-C to stop).
     try:
-        import shutil
         tail_cmd = shutil.which("tail")
         if tail_cmd:
             print(f"{Colors.BOLD}Tailing logs (press Ctrl-C to stop):{Colors.ENDC}")
@@ -316,27 +677,34 @@ def start_manual_services(supabase_local: bool) -> None:
 
 def stop_manual_services() -> None:
     """Stops all manually started services (Unix-like)."""
+    import subprocess
+
     if IS_WINDOWS:
         print("On Windows, please stop services manually (Task Manager / npx supabase stop / docker compose down).")
         return
 
     print(f"{Colors.BOLD}Stopping Manual Services...{Colors.ENDC}")
-    subprocess.run(["pkill", "-f", "python api.py"], stderr=subprocess.DEVNULL)
-    subprocess.run(["pkill", "-f", "next dev"], stderr=subprocess.DEVNULL)
-    subprocess.run(["pkill", "-f", "dramatiq run_agent_background"], stderr=subprocess.DEVNULL)
+    if not _stop_saved_pids():
+        for pids in _scan_procs(SERVICE_PATTERNS).values():
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except (ProcessLookupError, PermissionError):
+                    pass
     subprocess.run(["docker", "compose", "down"], shell=IS_WINDOWS, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     print(f"{Colors.GREEN}✅ All manual services stopped (best-effort).{Colors.ENDC}")
 
 
 def main() -> None:
-    setup_method = get_setup_method()
-    supabase_method = get_supabase_setup_method()
-
+    # Handle --help before touching .setup_progress or importing anything else
     if "--help" in sys.argv or "-h" in sys.argv:
         print("Usage: ./start.py [--help] [-f]")
         print("Start or stop local services. Uses the setup method selected in setup.py (docker or manual).")
         return
 
+    setup_method = get_setup_method()
+    supabase_method = get_supabase_setup_method()
+
     force = "-f" in sys.argv
 
     # If setup hasn't been run or method is not determined, stop and instruct the user
@@ -347,7 +715,9 @@ def main() -> None:
     # Docker path
     if setup_method == "docker":
         print(f"{Colors.BLUE}{Colors.BOLD}Docker Setup Detected{Colors.ENDC}")
-        running = docker_compose_is_up()
+        # The compose stack publishes the frontend on 3000, so a closed port means it is down without
+        # asking the daemon; an open one may be a hand-started `next dev`, so confirm with compose.
+        running = _port_open(FRONTEND_PORT) and docker_compose_is_up()
         if running:
             if force or input("🛑 Stop all Suna services? [y/N] ").strip().lower() == "y":
                 stop_docker_services()
@@ -365,6 +735,8 @@ def main() -> None:
 
         # On Windows: show instructions and allow starting redis only (automation is limited)
         if IS_WINDOWS:
+            import subprocess
+
             print_manual_instructions(supabase_local=(supabase_method == "local"))
             if force or input("Start infrastructure now (docker redis only)? [Y/n] ").strip().lower() != "n":
                 try:
@@ -377,12 +749,12 @@ def main() -> None:
 
         # POSIX path — continue with automatic start/stop handling
         # If any service is running, offer to stop
-        backend_running = subprocess.run(["pgrep", "-f", "python api.py"], capture_output=True).returncode == 0
-        frontend_running = subprocess.run(["pgrep", "-f", "next dev"], capture_output=True).returncode == 0
-        worker_running = subprocess.run(["pgrep", "-f", "dramatiq run_agent_background"], capture_output=True).returncode == 0
-        infra_up = subprocess.run(["docker", "compose", "ps", "-q", "redis"], capture_output=True, text=True, shell=IS_WINDOWS).stdout.strip() != ""
+        running = _scan_procs(SERVICE_PATTERNS)
+        # A closed port means Redis is down without forking; an open one may belong to a host
+        # redis-server or another project, so confirm it is this project's compose service.
+        infra_up = _port_open(REDIS_PORT) and compose_redis_is_up()
 
-        any_running = backend_running or frontend_running or worker_running or infra_up
+        any_running = any(running.values()) or infra_up
 
         if any_running:
             if not force and input("🛑 Stop all manual Suna services? [y/N] ").strip().lower() != "y":
@@ -395,7 +767,7 @@ def main() -> None:
         # Not running — start automatically without prompting. If the user prefers not to start services,
         # they can run './start.py -f' to force behavior or use the manual instructions below.
         print(f"{Colors.GREEN}⚡ No manual services detected — starting all manual Suna services now...{Colors.ENDC}")
-        start_manual_services(supabase_local=(supabase_method == "local"))
+        start_manual_services(supabase_local=(supabase_method == "local"), running=running)
         return
 
 